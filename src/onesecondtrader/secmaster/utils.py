@@ -1,19 +1,76 @@
 from __future__ import annotations
 
+import collections.abc
+import concurrent.futures
+import contextlib
+import itertools
 import json
 import logging
+import multiprocessing
+import operator
+import os
 import pathlib
+import posixpath
+import queue
 import shutil
 import sqlite3
 import tempfile
+import threading
 import zipfile
 
 import databento
 
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
 
 BATCH_SIZE = 10000
 LOG_EVERY_OHLCV = 1_000_000
 LOG_EVERY_SYMBOLOGY = 50_000
+DECODE_QUEUE_SIZE = 16
+DECODE_THREAD_QUEUE_SIZE = 8
+MAX_IN_MEMORY_DBN_BYTES = 1 << 30
+CACHED_STATEMENTS = 256
+
+# Single-schema DBN streams with one of these schemas contain only `OHLCVMsg` records and
+# are decoded column-wise into structured arrays.
+OHLCV_SCHEMAS = frozenset(
+    {
+        databento.Schema.OHLCV_1S,
+        databento.Schema.OHLCV_1M,
+        databento.Schema.OHLCV_1H,
+        databento.Schema.OHLCV_1D,
+        databento.Schema.OHLCV_EOD,
+    }
+)
+OHLCV_COLUMNS = (
+    "instrument_id",
+    "rtype",
+    "ts_event",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+)
+DEFER_INDEXES_MIN_BYTES = 64 * 1024 * 1024
+
+OHLCV_INSERT_SQL = (
+    "INSERT OR IGNORE INTO ohlcv "
+    "(instrument_id, rtype, ts_event, open, high, low, close, volume) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+INSTRUMENTS_BULK_INSERT_SQL = (
+    "INSERT OR IGNORE INTO instruments (publisher_ref, source_instrument_id) "
+    "SELECT ?, value FROM json_each(?)"
+)
+SYMBOLOGY_INSERT_SQL = (
+    "INSERT OR IGNORE INTO symbology "
+    "(publisher_ref, symbol, symbol_type, source_instrument_id, start_date, end_date) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +234,7 @@ def ingest_databento_zip(
     publisher_name: str = "databento",
     symbol_type: str = "raw_symbol",
     dataset: str | None = None,
+    max_workers: int | None = None,
 ) -> tuple[int, int]:
     """
     Ingest market data from a Databento zip archive into the security master database.
@@ -191,6 +249,9 @@ def ingest_databento_zip(
     Ingestion is idempotent with respect to primary keys: existing `ohlcv` and `symbology` rows are
     left unchanged.
 
+    If the archive contains more than one DBN file, the files are decoded in parallel worker
+    processes while the calling process remains the single writer to the database.
+
     Parameters:
         zip_path:
             Path to the Databento zip archive.
@@ -203,6 +264,9 @@ def ingest_databento_zip(
         dataset:
             Optional dataset override. If provided, it is used when `metadata.json` is missing or
             does not specify a dataset.
+        max_workers:
+            Maximum number of processes used to decode DBN files. Defaults to the number of CPUs,
+            capped at the number of DBN files in the archive.
 
     Returns:
         A tuple of (ohlcv_record_count_seen, symbology_record_count_seen).
@@ -215,16 +279,25 @@ def ingest_databento_zip(
     if not db_path.is_file():
         raise FileNotFoundError(f"Security master DB not found: {db_path}")
 
-    con = sqlite3.connect(str(db_path))
+    con = sqlite3.connect(
+        str(db_path), isolation_level=None, cached_statements=CACHED_STATEMENTS
+    )
+    deferred_indexes: list[tuple[str, str]] = []
 
     try:
         con.execute("PRAGMA foreign_keys = ON;")
         _assert_secmaster_db(con)
-        _enable_bulk_loading(con)
+        deferred_indexes = _enable_bulk_loading(
+            con, defer_indexes=zip_path.stat().st_size >= DEFER_INDEXES_MIN_BYTES
+        )
 
-        with con:
+        with _immediate_transaction(con):
             with zipfile.ZipFile(zip_path, "r") as zf:
-                dataset, venue = _extract_dataset_info(zf, dataset_override=dataset)
+                names = zf.namelist()
+                members_by_base = _index_zip_members(names)
+                dataset, venue = _extract_dataset_info(
+                    zf, dataset_override=dataset, members_by_base=members_by_base
+                )
                 logger.info(
                     "Publisher resolved: name=%s dataset=%s venue=%s",
                     publisher_name,
@@ -235,56 +308,46 @@ def ingest_databento_zip(
                     con, publisher_name, dataset, venue
                 )
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    dbn_files = [
-                        n
-                        for n in zf.namelist()
-                        if n.endswith(".dbn.zst") or n.endswith(".dbn")
-                    ]
-                    symbology_member = _zip_find_member(zf, "symbology.json")
-
-                    if not dbn_files and symbology_member is None:
-                        raise ValueError(
-                            "Archive contains no DBN files and no symbology.json"
-                        )
+                dbn_files = [
+                    n for n in names if n.endswith(".dbn.zst") or n.endswith(".dbn")
+                ]
+                symbology_member = _zip_find_member(members_by_base, "symbology.json")
+
+                if not dbn_files and symbology_member is None:
+                    raise ValueError(
+                        "Archive contains no DBN files and no symbology.json"
+                    )
 
-                    logger.info("Found %d DBN file(s) in archive", len(dbn_files))
+                logger.info("Found %d DBN file(s) in archive", len(dbn_files))
 
+                if len(dbn_files) > 1 and max_workers != 1:
+                    ohlcv_count += _ingest_dbn_parallel(
+                        zip_path, dbn_files, con, publisher_id, max_workers
+                    )
+                else:
                     for name in dbn_files:
-                        extracted_path = _zip_member_to_tempfile(zf, name, tmpdir)
-                        try:
-                            logger.info("Ingesting DBN file: %s", extracted_path.name)
-                            ohlcv_count += _ingest_dbn(
-                                extracted_path, con, publisher_id
-                            )
-                        finally:
-                            try:
-                                extracted_path.unlink()
-                            except FileNotFoundError:
-                                pass
-
-                    if symbology_member is not None:
+                        logger.info("Ingesting DBN file: %s", name)
+                        with _open_dbn_member(zf, name) as store:
+                            ohlcv_count += _ingest_dbn(store, name, con, publisher_id)
+
+                if symbology_member is not None:
+                    with tempfile.TemporaryDirectory() as tmpdir:
                         symbology_path = _zip_member_to_tempfile(
                             zf, symbology_member, tmpdir
                         )
-                        try:
-                            logger.info("Ingesting symbology.json")
-                            symbology_count += _ingest_symbology(
-                                symbology_path,
-                                con,
-                                publisher_id,
-                                symbol_type=symbol_type,
-                            )
-                        finally:
-                            try:
-                                symbology_path.unlink()
-                            except FileNotFoundError:
-                                pass
-                    else:
-                        logger.info("No symbology.json present in archive")
+                        logger.info("Ingesting symbology.json")
+                        symbology_count += _ingest_symbology(
+                            symbology_path,
+                            con,
+                            publisher_id,
+                            symbol_type=symbol_type,
+                        )
+                else:
+                    logger.info("No symbology.json present in archive")
     finally:
         try:
-            _disable_bulk_loading(con)
+            _disable_bulk_loading(con, deferred_indexes)
+            con.execute("PRAGMA optimize")
         finally:
             con.close()
 
@@ -330,14 +393,19 @@ def ingest_databento_dbn(
     if not db_path.is_file():
         raise FileNotFoundError(f"Security master DB not found: {db_path}")
 
-    con = sqlite3.connect(str(db_path))
+    con = sqlite3.connect(
+        str(db_path), isolation_level=None, cached_statements=CACHED_STATEMENTS
+    )
+    deferred_indexes: list[tuple[str, str]] = []
 
     try:
         con.execute("PRAGMA foreign_keys = ON;")
         _assert_secmaster_db(con)
-        _enable_bulk_loading(con)
+        deferred_indexes = _enable_bulk_loading(
+            con, defer_indexes=dbn_path.stat().st_size >= DEFER_INDEXES_MIN_BYTES
+        )
 
-        with con:
+        with _immediate_transaction(con):
             store = databento.DBNStore.from_file(dbn_path)
             dataset = store.metadata.dataset
             if not dataset:
@@ -352,10 +420,11 @@ def ingest_databento_dbn(
             )
 
             publisher_id = _get_or_create_publisher(con, publisher_name, dataset, venue)
-            count = _ingest_dbn(dbn_path, con, publisher_id)
+            count = _ingest_dbn(store, dbn_path.name, con, publisher_id)
     finally:
         try:
-            _disable_bulk_loading(con)
+            _disable_bulk_loading(con, deferred_indexes)
+            con.execute("PRAGMA optimize")
         finally:
             con.close()
 
@@ -366,11 +435,29 @@ def ingest_databento_dbn(
     return count
 
 
+@contextlib.contextmanager
+def _immediate_transaction(
+    con: sqlite3.Connection,
+) -> collections.abc.Iterator[None]:
+    # Expects an autocommit connection (`isolation_level=None`) so that the transaction
+    # boundaries are exactly the ones issued here.
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    con.execute("COMMIT")
+
+
 def _extract_dataset_info(
     zf: zipfile.ZipFile,
     dataset_override: str | None = None,
+    members_by_base: dict[str, list[str]] | None = None,
 ) -> tuple[str, str | None]:
-    metadata_member = _zip_find_member(zf, "metadata.json")
+    if members_by_base is None:
+        members_by_base = _index_zip_members(zf.namelist())
+    metadata_member = _zip_find_member(members_by_base, "metadata.json")
     if metadata_member is None:
         if dataset_override is None:
             raise ValueError(
@@ -392,16 +479,19 @@ def _extract_dataset_info(
     return dataset, venue
 
 
+def _index_zip_members(names: list[str]) -> dict[str, list[str]]:
+    members_by_base: dict[str, list[str]] = {}
+    for name in names:
+        members_by_base.setdefault(posixpath.basename(name), []).append(name)
+    return members_by_base
+
+
 def _zip_find_member(
-    zf: zipfile.ZipFile,
+    members_by_base: dict[str, list[str]],
     basename: str,
     allow_multiple: bool = False,
 ) -> str | None:
-    candidates = [
-        name
-        for name in zf.namelist()
-        if name == basename or name.endswith("/" + basename)
-    ]
+    candidates = members_by_base.get(basename, [])
     if not candidates:
         return None
     if len(candidates) == 1:
@@ -439,20 +529,13 @@ def _get_or_create_publisher(
     dataset: str,
     venue: str | None,
 ) -> int:
-    cursor = con.cursor()
-    cursor.execute(
-        "SELECT publisher_id FROM publishers WHERE name = ? AND dataset = ?",
-        (name, dataset),
-    )
-    row = cursor.fetchone()
-    if row:
-        return row[0]
-
-    cursor.execute(
-        "INSERT INTO publishers (name, dataset, venue) VALUES (?, ?, ?)",
+    row = con.execute(
+        "INSERT INTO publishers (name, dataset, venue) VALUES (?, ?, ?) "
+        "ON CONFLICT (name, dataset) DO UPDATE SET name = name "
+        "RETURNING publisher_id",
         (name, dataset, venue),
-    )
-    return cursor.lastrowid  # type: ignore[return-value]
+    ).fetchone()
+    return row[0]
 
 
 def _get_or_create_instrument(
@@ -460,20 +543,14 @@ def _get_or_create_instrument(
     publisher_id: int,
     source_instrument_id: int,
 ) -> int:
-    cursor = con.cursor()
-    cursor.execute(
-        "SELECT instrument_id FROM instruments WHERE publisher_ref = ? AND source_instrument_id = ?",
+    row = con.execute(
+        "INSERT INTO instruments (publisher_ref, source_instrument_id) VALUES (?, ?) "
+        "ON CONFLICT (publisher_ref, source_instrument_id) DO UPDATE "
+        "SET publisher_ref = publisher_ref "
+        "RETURNING instrument_id",
         (publisher_id, source_instrument_id),
-    )
-    row = cursor.fetchone()
-    if row:
-        return row[0]
-
-    cursor.execute(
-        "INSERT INTO instruments (publisher_ref, source_instrument_id) VALUES (?, ?)",
-        (publisher_id, source_instrument_id),
-    )
-    return cursor.lastrowid  # type: ignore[return-value]
+    ).fetchone()
+    return row[0]
 
 
 def _assert_secmaster_db(
@@ -501,72 +578,226 @@ def _assert_secmaster_db(
         )
 
 
+def _open_dbn_member(
+    zf: zipfile.ZipFile,
+    member_name: str,
+) -> contextlib.AbstractContextManager[databento.DBNStore]:
+    if zf.getinfo(member_name).file_size <= MAX_IN_MEMORY_DBN_BYTES:
+        return contextlib.nullcontext(
+            databento.DBNStore.from_bytes(zf.read(member_name))
+        )
+    return _open_dbn_member_via_tempfile(zf, member_name)
+
+
+@contextlib.contextmanager
+def _open_dbn_member_via_tempfile(
+    zf: zipfile.ZipFile,
+    member_name: str,
+) -> collections.abc.Iterator[databento.DBNStore]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        extracted_path = _zip_member_to_tempfile(zf, member_name, tmpdir)
+        yield databento.DBNStore.from_file(extracted_path)
+
+
 def _ingest_dbn(
-    dbn_path: pathlib.Path,
+    store: databento.DBNStore,
+    source_name: str,
     con: sqlite3.Connection,
     publisher_id: int,
 ) -> int:
-    store = databento.DBNStore.from_file(dbn_path)
-    cursor = con.cursor()
-
     instrument_cache: dict[int, int] = {}
-    batch: list[tuple] = []
     count = 0
 
-    logger.info("Streaming OHLCV records from: %s", dbn_path.name)
+    logger.info("Streaming OHLCV records from: %s", source_name)
 
-    for record in store:
-        if not isinstance(record, databento.OHLCVMsg):
-            continue
+    for batch in _decode_in_background(store):
+        count = _write_ohlcv_batch(
+            con, publisher_id, batch, instrument_cache, count, source_name
+        )
 
-        source_id = record.instrument_id
-        if source_id not in instrument_cache:
-            instrument_cache[source_id] = _get_or_create_instrument(
-                con, publisher_id, source_id
-            )
-        internal_id = instrument_cache[source_id]
+    logger.info("Completed OHLCV ingest from %s (%d records)", source_name, count)
 
-        rtype_val = (
-            record.rtype.value if hasattr(record.rtype, "value") else record.rtype
-        )
+    return count
+
+
+def _ingest_dbn_parallel(
+    zip_path: pathlib.Path,
+    member_names: list[str],
+    con: sqlite3.Connection,
+    publisher_id: int,
+    max_workers: int | None = None,
+) -> int:
+    workers = min(len(member_names), max_workers or os.cpu_count() or 1)
+
+    instrument_cache: dict[int, int] = {}
+    counts: dict[str, int] = {}
+
+    logger.info(
+        "Decoding %d DBN file(s) with %d worker process(es)",
+        len(member_names),
+        workers,
+    )
 
-        batch.append(
-            (
-                internal_id,
-                rtype_val,
-                record.ts_event,
-                record.open,
-                record.high,
-                record.low,
-                record.close,
-                record.volume,
+    with (
+        multiprocessing.Manager() as manager,
+        concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool,
+    ):
+        batch_queue = manager.Queue(maxsize=DECODE_QUEUE_SIZE)
+        futures = [
+            pool.submit(_decode_dbn_worker, zip_path, name, batch_queue)
+            for name in member_names
+        ]
+
+        remaining = len(futures)
+        while remaining:
+            name, batch = batch_queue.get()
+            if batch is None:
+                remaining -= 1
+                logger.info(
+                    "Completed OHLCV ingest from %s (%d records)",
+                    name,
+                    counts.get(name, 0),
+                )
+                continue
+            counts[name] = _write_ohlcv_batch(
+                con, publisher_id, batch, instrument_cache, counts.get(name, 0), name
             )
+
+        for future in futures:
+            future.result()
+
+    return sum(counts.values())
+
+
+def _decode_dbn_worker(
+    zip_path: pathlib.Path,
+    member_name: str,
+    batch_queue: queue.Queue[tuple[str, list[tuple] | None]],
+) -> None:
+    try:
+        with (
+            zipfile.ZipFile(zip_path, "r") as zf,
+            _open_dbn_member(zf, member_name) as store,
+        ):
+            for batch in _iter_ohlcv_batches(store):
+                batch_queue.put((member_name, batch))
+    finally:
+        batch_queue.put((member_name, None))
+
+
+def _decode_in_background(
+    store: databento.DBNStore,
+) -> collections.abc.Iterator[list[tuple]]:
+    # Decompression and decoding run on a separate thread so they overlap with the SQLite
+    # writes issued by the caller; the bounded queue provides backpressure.
+    batch_queue: queue.Queue[list[tuple] | BaseException | None] = queue.Queue(
+        maxsize=DECODE_THREAD_QUEUE_SIZE
+    )
+    stop = threading.Event()
+
+    def _decode() -> None:
+        try:
+            for batch in _iter_ohlcv_batches(store):
+                if stop.is_set():
+                    return
+                # Copied because `_iter_ohlcv_batches` may reuse its buffer.
+                batch_queue.put(batch.copy())
+        except BaseException as exc:
+            batch_queue.put(exc)
+        else:
+            batch_queue.put(None)
+
+    thread = threading.Thread(target=_decode, name="dbn-decoder", daemon=True)
+    thread.start()
+
+    try:
+        while (item := batch_queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        while thread.is_alive():
+            try:
+                batch_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def _iter_ohlcv_batches(
+    store: databento.DBNStore,
+) -> collections.abc.Iterator[list[tuple]]:
+    if store.metadata.schema in OHLCV_SCHEMAS:
+        # Decode whole batches into structured arrays and convert each column with a single
+        # `tolist` call instead of reading every field of every record individually.
+        for chunk in store.to_ndarray(count=BATCH_SIZE):
+            if len(chunk):
+                yield list(zip(*(chunk[column].tolist() for column in OHLCV_COLUMNS)))
+        return
+
+    # The buffer is reused between batches; consumers must not keep a reference to a
+    # yielded batch beyond the next iteration.
+    batch: list[tuple] = [()] * BATCH_SIZE
+    idx = 0
+
+    ohlcv_msg = databento.OHLCVMsg
+    records = (r for r in store if type(r) is ohlcv_msg)
+    first = next(records, None)
+    if first is None:
+        return
+
+    # All records of a file share the same rtype representation, so it is resolved once.
+    rtype_of = operator.attrgetter(
+        "rtype.value" if hasattr(first.rtype, "value") else "rtype"
+    )
+
+    for record in itertools.chain((first,), records):
+        batch[idx] = (
+            record.instrument_id,
+            rtype_of(record),
+            record.ts_event,
+            record.open,
+            record.high,
+            record.low,
+            record.close,
+            record.volume,
         )
-        count += 1
+        idx += 1
+
+        if idx == BATCH_SIZE:
+            yield batch
+            idx = 0
+
+    if idx:
+        yield batch[:idx]
 
-        if count % LOG_EVERY_OHLCV == 0:
-            logger.info("Ingested %d OHLCV records from %s", count, dbn_path.name)
 
-        if len(batch) >= BATCH_SIZE:
-            cursor.executemany(
-                "INSERT OR IGNORE INTO ohlcv "
-                "(instrument_id, rtype, ts_event, open, high, low, close, volume) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                batch,
+def _write_ohlcv_batch(
+    con: sqlite3.Connection,
+    publisher_id: int,
+    batch: list[tuple],
+    instrument_cache: dict[int, int],
+    count: int,
+    source_name: str,
+) -> int:
+    rows: list[tuple] = []
+    append = rows.append
+    cache_get = instrument_cache.get
+    for source_id, *values in batch:
+        internal_id = cache_get(source_id)
+        if internal_id is None:
+            internal_id = instrument_cache[source_id] = _get_or_create_instrument(
+                con, publisher_id, source_id
             )
-            batch.clear()
-
-    if batch:
-        cursor.executemany(
-            "INSERT OR IGNORE INTO ohlcv "
-            "(instrument_id, rtype, ts_event, open, high, low, close, volume) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            batch,
-        )
+        append((internal_id, *values))
 
-    logger.info("Completed OHLCV ingest from %s (%d records)", dbn_path.name, count)
+    con.executemany(OHLCV_INSERT_SQL, rows)
 
-    return count
+    new_count = count + len(rows)
+    if new_count // LOG_EVERY_OHLCV > count // LOG_EVERY_OHLCV:
+        logger.info("Ingested %d OHLCV records from %s", new_count, source_name)
+
+    return new_count
 
 
 def _ingest_symbology(
@@ -578,25 +809,16 @@ def _ingest_symbology(
     if not isinstance(symbol_type, str) or not symbol_type:
         raise ValueError("symbol_type must be a non-empty string")
 
-    with open(json_path, "r") as f:
-        data = json.load(f)
-
-    if not isinstance(data, dict):
-        raise ValueError("symbology.json root must be a JSON object")
-
-    result = data.get("result", {})
-    if not isinstance(result, dict):
-        raise ValueError("symbology.json['result'] must be an object")
-    cursor = con.cursor()
-
-    batch: list[tuple] = []
+    batch: list[tuple] = [()] * BATCH_SIZE
+    idx = 0
     count = 0
 
     logger.info("Streaming symbology mappings from: %s", json_path.name)
 
     instrument_cache: set[int] = set()
+    pending_instruments: list[int] = []
 
-    for symbol, mappings in result.items():
+    for symbol, mappings in _iter_symbology_result(json_path):
         if not isinstance(mappings, list):
             raise ValueError(
                 f"symbology.json mappings must be a list for symbol={symbol!r}"
@@ -618,19 +840,18 @@ def _ingest_symbology(
             source_id = int(mapping["s"])
 
             if source_id not in instrument_cache:
-                _get_or_create_instrument(con, publisher_id, source_id)
+                pending_instruments.append(source_id)
                 instrument_cache.add(source_id)
 
-            batch.append(
-                (
-                    publisher_id,
-                    symbol,
-                    symbol_type,
-                    source_id,
-                    mapping["d0"],
-                    mapping["d1"],
-                )
+            batch[idx] = (
+                publisher_id,
+                symbol,
+                symbol_type,
+                source_id,
+                mapping["d0"],
+                mapping["d1"],
             )
+            idx += 1
             count += 1
 
             if count % LOG_EVERY_SYMBOLOGY == 0:
@@ -638,22 +859,14 @@ def _ingest_symbology(
                     "Ingested %d symbology mappings from %s", count, json_path.name
                 )
 
-            if len(batch) >= BATCH_SIZE:
-                cursor.executemany(
-                    "INSERT OR IGNORE INTO symbology "
-                    "(publisher_ref, symbol, symbol_type, source_instrument_id, start_date, end_date) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
-                    batch,
-                )
-                batch.clear()
-
-    if batch:
-        cursor.executemany(
-            "INSERT OR IGNORE INTO symbology "
-            "(publisher_ref, symbol, symbol_type, source_instrument_id, start_date, end_date) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            batch,
-        )
+            if idx == BATCH_SIZE:
+                _insert_instruments(con, publisher_id, pending_instruments)
+                con.executemany(SYMBOLOGY_INSERT_SQL, batch)
+                idx = 0
+
+    if idx:
+        _insert_instruments(con, publisher_id, pending_instruments)
+        con.executemany(SYMBOLOGY_INSERT_SQL, batch[:idx])
 
     _validate_no_overlapping_symbology(con, publisher_id, symbol_type)
 
@@ -664,6 +877,53 @@ def _ingest_symbology(
     return count
 
 
+def _insert_instruments(
+    con: sqlite3.Connection,
+    publisher_id: int,
+    source_ids: list[int],
+) -> None:
+    # Materializes all instruments referenced by a symbology batch in one statement, ahead
+    # of the batch itself so that the foreign keys resolve.
+    if source_ids:
+        con.execute(INSTRUMENTS_BULK_INSERT_SQL, (publisher_id, json.dumps(source_ids)))
+        source_ids.clear()
+
+
+def _iter_symbology_result(
+    json_path: pathlib.Path,
+) -> collections.abc.Iterator[tuple[str, object]]:
+    # With ijson available, symbol mappings are streamed so the whole document is never
+    # held in memory; otherwise the file is parsed in one go with the standard library.
+    if ijson is None:
+        with open(json_path, "rb") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("symbology.json root must be a JSON object")
+        result = data.get("result", {})
+        if not isinstance(result, dict):
+            raise ValueError("symbology.json['result'] must be an object")
+        yield from result.items()
+        return
+
+    with open(json_path, "rb") as f:
+        try:
+            events = ijson.parse(f)
+            first = next(events, None)
+            if first is None or first[1] != "start_map":
+                raise ValueError("symbology.json root must be a JSON object")
+            for prefix, event, _ in events:
+                if prefix == "result":
+                    if event != "start_map":
+                        raise ValueError("symbology.json['result'] must be an object")
+                    break
+            else:
+                return
+            f.seek(0)
+            yield from ijson.kvitems(f, "result", use_float=True)
+        except ijson.JSONError as exc:
+            raise ValueError(f"symbology.json is not valid JSON: {exc}") from exc
+
+
 def _validate_no_overlapping_symbology(
     con: sqlite3.Connection,
     publisher_id: int,
@@ -695,13 +955,46 @@ def _validate_no_overlapping_symbology(
         )
 
 
-def _enable_bulk_loading(con: sqlite3.Connection) -> None:
+def _enable_bulk_loading(
+    con: sqlite3.Connection, defer_indexes: bool = False
+) -> list[tuple[str, str]]:
     con.execute("PRAGMA journal_mode = WAL")
     con.execute("PRAGMA synchronous = NORMAL")
     con.execute("PRAGMA cache_size = -64000")
+    con.execute("PRAGMA cache_spill = OFF")
+
+    if not defer_indexes:
+        return []
+
+    deferred = con.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND sql IS NOT NULL "
+        "AND tbl_name IN ('ohlcv', 'symbology')"
+    ).fetchall()
+    for name, _ in deferred:
+        con.execute(f'DROP INDEX "{name}"')
+    if deferred:
+        logger.info(
+            "Deferred %d secondary index(es) until ingest completes", len(deferred)
+        )
+    return deferred
 
 
-def _disable_bulk_loading(con: sqlite3.Connection) -> None:
+def _disable_bulk_loading(
+    con: sqlite3.Connection, deferred_indexes: list[tuple[str, str]] | None = None
+) -> None:
+    if deferred_indexes:
+        present = {
+            r[0]
+            for r in con.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            ).fetchall()
+        }
+        for name, sql in deferred_indexes:
+            if name not in present:
+                logger.info("Rebuilding index %s", name)
+                con.execute(sql)
     con.execute("PRAGMA synchronous = FULL")
     con.execute("PRAGMA journal_mode = DELETE")
     con.execute("PRAGMA cache_size = -2000")
+    con.execute("PRAGMA cache_spill = ON")
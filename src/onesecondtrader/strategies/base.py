@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import abc
+import collections.abc
 import dataclasses
 import enum
 import importlib.util
 import uuid
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from onesecondtrader import events, indicators, messaging, models
@@ -215,25 +218,35 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
             value = overrides.get(name, spec.default)
             setattr(self, name, value)
 
-        self._subscribe(
-            events.market.BarReceived,
-            events.responses.OrderAccepted,
-            events.responses.ModificationAccepted,
-            events.responses.CancellationAccepted,
-            events.responses.OrderRejected,
-            events.responses.ModificationRejected,
-            events.responses.CancellationRejected,
-            events.orders.FillEvent,
-            events.orders.OrderExpired,
-        )
+        # Event type -> handler; subclasses of these types are resolved lazily via their MRO
+        self._handlers: dict[type, collections.abc.Callable[[Any], None] | None] = {
+            events.market.BarReceived: self._on_bar_received,
+            events.responses.OrderAccepted: self._on_order_submission_accepted,
+            events.responses.ModificationAccepted: self._on_order_modification_accepted,
+            events.responses.CancellationAccepted: self._on_order_cancellation_accepted,
+            events.responses.OrderRejected: self._on_order_submission_rejected,
+            events.responses.ModificationRejected: self._on_order_modification_rejected,
+            events.responses.CancellationRejected: self._on_order_cancellation_rejected,
+            events.orders.FillEvent: self._on_order_filled,
+            events.orders.OrderExpired: self._on_order_expired,
+        }
+        self._subscribe(*self._handlers)
 
         self._current_symbol: str = ""
+        self._current_sym_idx: int = -1
         self._current_ts: pd.Timestamp = pd.Timestamp.now(tz="UTC")
         self._indicators: list[indicators.IndicatorBase] = []
+        self._indicator_updates: tuple[
+            collections.abc.Callable[[events.market.BarReceived], None], ...
+        ] = ()
 
         self._fills: dict[str, list[FillRecord]] = {}
-        self._positions: dict[str, float] = {}
-        self._avg_prices: dict[str, float] = {}
+        # Per-symbol position state as parallel arrays indexed via `_sym_idx`
+        self._sym_idx: dict[str, int] = {}
+        for symbol in self.symbols:
+            self._sym_idx.setdefault(symbol, len(self._sym_idx))
+        self._positions: np.ndarray = np.zeros(len(self._sym_idx))
+        self._avg_prices: np.ndarray = np.zeros(len(self._sym_idx))
         self._pending_orders: dict[uuid.UUID, OrderRecord] = {}
         self._submitted_orders: dict[uuid.UUID, OrderRecord] = {}
         self._submitted_modifications: dict[uuid.UUID, OrderRecord] = {}
@@ -264,6 +277,7 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
             The registered indicator instance.
         """
         self._indicators.append(ind)
+        self._indicator_updates += (ind.update,)
         return ind
 
     @property
@@ -273,7 +287,9 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
 
         The active symbol is set by the most recently processed bar event.
         """
-        return self._positions.get(self._current_symbol, 0.0)
+        if self._current_sym_idx < 0:
+            return 0.0
+        return float(self._positions[self._current_sym_idx])
 
     @property
     def avg_price(self) -> float:
@@ -282,7 +298,9 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
 
         Returns zero if there is no open position.
         """
-        return self._avg_prices.get(self._current_symbol, 0.0)
+        if self._current_sym_idx < 0:
+            return 0.0
+        return float(self._avg_prices[self._current_sym_idx])
 
     def submit_order(
         self,
@@ -428,27 +446,24 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
         return True
 
     def _on_event(self, event: events.EventBase) -> None:
-        match event:
-            case events.market.BarReceived() as bar_event:
-                self._on_bar_received(bar_event)
-            case events.responses.OrderAccepted() as accepted:
-                self._on_order_submission_accepted(accepted)
-            case events.responses.ModificationAccepted() as accepted:
-                self._on_order_modification_accepted(accepted)
-            case events.responses.CancellationAccepted() as accepted:
-                self._on_order_cancellation_accepted(accepted)
-            case events.responses.OrderRejected() as rejected:
-                self._on_order_submission_rejected(rejected)
-            case events.responses.ModificationRejected() as rejected:
-                self._on_order_modification_rejected(rejected)
-            case events.responses.CancellationRejected() as rejected:
-                self._on_order_cancellation_rejected(rejected)
-            case events.orders.FillEvent() as filled:
-                self._on_order_filled(filled)
-            case events.orders.OrderExpired() as expired:
-                self._on_order_expired(expired)
-            case _:
-                return
+        event_type = type(event)
+        try:
+            handler = self._handlers[event_type]
+        except KeyError:
+            handler = self._resolve_handler(event_type)
+        if handler is not None:
+            handler(event)
+
+    def _resolve_handler(
+        self, event_type: type
+    ) -> collections.abc.Callable[[Any], None] | None:
+        handler = None
+        for base in event_type.__mro__[1:]:
+            handler = self._handlers.get(base)
+            if handler is not None:
+                break
+        self._handlers[event_type] = handler
+        return handler
 
     def _on_bar_received(self, event: events.market.BarReceived) -> None:
         if event.symbol not in self.symbols:
@@ -457,10 +472,11 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
             return
 
         self._current_symbol = event.symbol
+        self._current_sym_idx = self._sym_idx[event.symbol]
         self._current_ts = pd.Timestamp(event.ts_event_ns, tz="UTC")
 
-        for ind in self._indicators:
-            ind.update(event)
+        for update in self._indicator_updates:
+            update(event)
 
         self._emit_processed_bar(event)
         self.on_bar(event)
@@ -557,8 +573,9 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
             case models.TradeSide.SELL:
                 signed_qty = -fill_qty
 
-        old_pos = self._positions.get(symbol, 0.0)
-        old_avg = self._avg_prices.get(symbol, 0.0)
+        idx = self._symbol_index(symbol)
+        old_pos = float(self._positions[idx])
+        old_avg = float(self._avg_prices[idx])
         new_pos = old_pos + signed_qty
 
         if new_pos == 0.0:
@@ -575,8 +592,17 @@ class StrategyBase(messaging.Subscriber, abc.ABC):
             else:
                 new_avg = fill_price
 
-        self._positions[symbol] = new_pos
-        self._avg_prices[symbol] = new_avg
+        self._positions[idx] = new_pos
+        self._avg_prices[idx] = new_avg
+
+    def _symbol_index(self, symbol: str) -> int:
+        idx = self._sym_idx.get(symbol)
+        if idx is None:
+            # Fills may arrive for symbols outside `symbols`; track them in appended slots
+            idx = self._sym_idx[symbol] = len(self._sym_idx)
+            self._positions = np.append(self._positions, 0.0)
+            self._avg_prices = np.append(self._avg_prices, 0.0)
+        return idx
 
     def _on_order_expired(self, event: events.orders.OrderExpired) -> None:
         self._pending_orders.pop(event.associated_order_id, None)
@@ -2,6 +2,8 @@ import json
 import sqlite3
 import zipfile
 
+import databento_dbn
+
 from onesecondtrader.secmaster.utils import _ingest_symbology, create_secmaster_db
 
 
@@ -11,6 +13,27 @@ def _make_db(tmp_path):
     return db_path
 
 
+def _make_dbn_bytes(records, dataset="XNAS.ITCH", schema=databento_dbn.Schema.OHLCV_1M):
+    metadata = databento_dbn.Metadata(
+        dataset=dataset,
+        schema=schema,
+        start=0,
+        stype_in=databento_dbn.SType.RAW_SYMBOL,
+        stype_out=databento_dbn.SType.INSTRUMENT_ID,
+        end=2**63,
+        symbols=[],
+        partial=[],
+        not_found=[],
+        mappings=[],
+    )
+    data = bytes(metadata.encode())
+    for source_id, ts_event, o, h, lo, c, v in records:
+        data += bytes(
+            databento_dbn.OHLCVMsg(33, 1, source_id, ts_event, o, h, lo, c, v)
+        )
+    return data
+
+
 def _make_publisher(con):
     cur = con.cursor()
     cur.execute(
@@ -244,7 +267,7 @@ def test_extract_dataset_info_missing_metadata_requires_override(tmp_path):
 
 
 def test_zip_find_member_raises_on_duplicates_by_default(tmp_path):
-    from onesecondtrader.secmaster.utils import _zip_find_member
+    from onesecondtrader.secmaster.utils import _index_zip_members, _zip_find_member
 
     zip_path = tmp_path / "sample.zip"
     with zipfile.ZipFile(zip_path, "w") as zf:
@@ -253,14 +276,16 @@ def test_zip_find_member_raises_on_duplicates_by_default(tmp_path):
 
     with zipfile.ZipFile(zip_path, "r") as zf:
         try:
-            _zip_find_member(zf, "metadata.json")
+            _zip_find_member(_index_zip_members(zf.namelist()), "metadata.json")
         except ValueError as e:
             assert "Multiple metadata.json members" in str(e)
         else:
             raise AssertionError("Expected ValueError")
 
     with zipfile.ZipFile(zip_path, "r") as zf:
-        member = _zip_find_member(zf, "metadata.json", allow_multiple=True)
+        member = _zip_find_member(
+            _index_zip_members(zf.namelist()), "metadata.json", allow_multiple=True
+        )
     assert member == "a/metadata.json"
 
 
@@ -538,3 +563,232 @@ def test_assert_secmaster_db_rejects_missing_tables(tmp_path):
         assert "missing required tables" in str(e)
     else:
         raise AssertionError("Expected DatabaseError")
+
+
+def test_ingest_databento_dbn_inserts_ohlcv(tmp_path):
+    from onesecondtrader.secmaster.utils import ingest_databento_dbn
+
+    db_path = _make_db(tmp_path)
+    dbn_path = tmp_path / "sample.dbn"
+    dbn_path.write_bytes(
+        _make_dbn_bytes(
+            [
+                (100, 1_000, 10, 12, 9, 11, 5),
+                (100, 2_000, 11, 13, 10, 12, 6),
+                (200, 1_000, 20, 22, 19, 21, 7),
+            ]
+        )
+    )
+
+    assert ingest_databento_dbn(dbn_path, db_path) == 3
+
+    con = sqlite3.connect(str(db_path))
+    rows = con.execute(
+        "SELECT i.source_instrument_id, o.rtype, o.ts_event, o.close, o.volume "
+        "FROM ohlcv o JOIN instruments i ON i.instrument_id = o.instrument_id "
+        "ORDER BY i.source_instrument_id, o.ts_event"
+    ).fetchall()
+    assert rows == [
+        (100, 33, 1_000, 11, 5),
+        (100, 33, 2_000, 12, 6),
+        (200, 33, 1_000, 21, 7),
+    ]
+
+
+def test_ingest_databento_zip_decodes_multiple_dbn_files_in_parallel(tmp_path):
+    from onesecondtrader.secmaster.utils import ingest_databento_zip
+
+    db_path = _make_db(tmp_path)
+    zip_path = tmp_path / "sample.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("metadata.json", json.dumps({"query": {"dataset": "XNAS.ITCH"}}))
+        zf.writestr(
+            "a.ohlcv-1m.dbn",
+            _make_dbn_bytes(
+                [(100, 1_000, 10, 12, 9, 11, 5), (100, 2_000, 11, 13, 10, 12, 6)]
+            ),
+        )
+        zf.writestr(
+            "b.ohlcv-1m.dbn", _make_dbn_bytes([(200, 1_000, 20, 22, 19, 21, 7)])
+        )
+
+    ohlcv_count, symbology_count = ingest_databento_zip(
+        zip_path, db_path, max_workers=2
+    )
+
+    assert (ohlcv_count, symbology_count) == (3, 0)
+
+    con = sqlite3.connect(str(db_path))
+    assert con.execute("SELECT COUNT(*) FROM ohlcv").fetchone()[0] == 3
+    assert con.execute("SELECT COUNT(*) FROM instruments").fetchone()[0] == 2
+
+
+def test_ingest_databento_zip_falls_back_to_tempfile_for_large_members(
+    tmp_path, monkeypatch
+):
+    from onesecondtrader.secmaster import utils
+
+    monkeypatch.setattr(utils, "MAX_IN_MEMORY_DBN_BYTES", 0)
+
+    db_path = _make_db(tmp_path)
+    zip_path = tmp_path / "sample.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("metadata.json", json.dumps({"query": {"dataset": "XNAS.ITCH"}}))
+        zf.writestr("a.ohlcv-1m.dbn", _make_dbn_bytes([(100, 1_000, 10, 12, 9, 11, 5)]))
+
+    assert utils.ingest_databento_zip(zip_path, db_path, max_workers=1) == (1, 0)
+
+    con = sqlite3.connect(str(db_path))
+    assert con.execute("SELECT COUNT(*) FROM ohlcv").fetchone()[0] == 1
+    con.close()
+
+
+def test_get_or_create_returns_existing_ids(tmp_path):
+    from onesecondtrader.secmaster.utils import (
+        _get_or_create_instrument,
+        _get_or_create_publisher,
+    )
+
+    db_path = _make_db(tmp_path)
+    con = sqlite3.connect(str(db_path))
+    con.execute("PRAGMA foreign_keys = ON;")
+
+    publisher_id = _get_or_create_publisher(con, "databento", "XNAS.ITCH", "XNAS")
+    assert _get_or_create_publisher(con, "databento", "XNAS.ITCH", None) == publisher_id
+    assert _get_or_create_publisher(con, "databento", "GLBX.MDP3", None) != publisher_id
+
+    instrument_id = _get_or_create_instrument(con, publisher_id, 42)
+    assert _get_or_create_instrument(con, publisher_id, 42) == instrument_id
+    assert con.execute("SELECT COUNT(*) FROM instruments").fetchone()[0] == 1
+    assert (
+        con.execute(
+            "SELECT venue FROM publishers WHERE publisher_id = ?", (publisher_id,)
+        ).fetchone()[0]
+        == "XNAS"
+    )
+    con.close()
+
+
+def test_ingest_databento_zip_rebuilds_deferred_indexes(tmp_path, monkeypatch):
+    from onesecondtrader.secmaster import utils
+
+    monkeypatch.setattr(utils, "DEFER_INDEXES_MIN_BYTES", 0)
+
+    db_path = _make_db(tmp_path)
+    zip_path = tmp_path / "sample.zip"
+    symbology_json = {
+        "result": {"AAPL": [{"s": 100, "d0": "2020-01-01", "d1": "2020-12-31"}]}
+    }
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("metadata.json", json.dumps({"query": {"dataset": "XNAS.ITCH"}}))
+        zf.writestr("symbology.json", json.dumps(symbology_json))
+        zf.writestr("a.ohlcv-1m.dbn", _make_dbn_bytes([(100, 1_000, 10, 12, 9, 11, 5)]))
+
+    assert utils.ingest_databento_zip(zip_path, db_path) == (1, 1)
+
+    con = sqlite3.connect(str(db_path))
+    indexes = {
+        r[0]
+        for r in con.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        ).fetchall()
+    }
+    con.close()
+    assert "idx_symbology_symbol" in indexes
+
+
+def test_ingest_databento_zip_rolls_back_on_error(tmp_path):
+    from onesecondtrader.secmaster.utils import ingest_databento_zip
+
+    db_path = _make_db(tmp_path)
+    zip_path = tmp_path / "sample.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("metadata.json", json.dumps({"query": {"dataset": "XNAS.ITCH"}}))
+        zf.writestr("a.ohlcv-1m.dbn", _make_dbn_bytes([(100, 1_000, 10, 12, 9, 11, 5)]))
+        zf.writestr("symbology.json", json.dumps({"result": {"AAPL": {}}}))
+
+    try:
+        ingest_databento_zip(zip_path, db_path)
+    except ValueError as e:
+        assert "must be a list" in str(e)
+    else:
+        raise AssertionError("Expected ValueError")
+
+    con = sqlite3.connect(str(db_path))
+    for table in ("publishers", "instruments", "ohlcv"):
+        assert con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 0
+    con.close()
+
+
+def test_ingest_databento_dbn_handles_partial_and_full_batches(tmp_path, monkeypatch):
+    from onesecondtrader.secmaster import utils
+
+    monkeypatch.setattr(utils, "BATCH_SIZE", 2)
+
+    db_path = _make_db(tmp_path)
+    dbn_path = tmp_path / "sample.dbn"
+    dbn_path.write_bytes(
+        _make_dbn_bytes(
+            [
+                (100, 1_000, 10, 12, 9, 11, 5),
+                (100, 2_000, 11, 13, 10, 12, 6),
+                (100, 3_000, 12, 14, 11, 13, 7),
+                (100, 4_000, 13, 15, 12, 14, 8),
+                (100, 5_000, 14, 16, 13, 15, 9),
+            ]
+        )
+    )
+
+    assert utils.ingest_databento_dbn(dbn_path, db_path) == 5
+
+    con = sqlite3.connect(str(db_path))
+    rows = con.execute("SELECT ts_event, close FROM ohlcv ORDER BY ts_event").fetchall()
+    con.close()
+    assert rows == [(1_000, 11), (2_000, 12), (3_000, 13), (4_000, 14), (5_000, 15)]
+
+
+def test_ingest_databento_dbn_filters_records_of_mixed_schema_streams(tmp_path):
+    from onesecondtrader.secmaster.utils import ingest_databento_dbn
+
+    db_path = _make_db(tmp_path)
+    dbn_path = tmp_path / "sample.dbn"
+    dbn_path.write_bytes(
+        _make_dbn_bytes(
+            [(100, 1_000, 10, 12, 9, 11, 5), (200, 1_000, 20, 22, 19, 21, 7)],
+            schema=None,
+        )
+    )
+
+    assert ingest_databento_dbn(dbn_path, db_path) == 2
+
+    con = sqlite3.connect(str(db_path))
+    rows = con.execute(
+        "SELECT rtype, ts_event, close FROM ohlcv ORDER BY close"
+    ).fetchall()
+    con.close()
+    assert rows == [(33, 1_000, 11), (33, 1_000, 21)]
+
+
+def test_ingest_databento_dbn_propagates_decoder_errors(tmp_path, monkeypatch):
+    from onesecondtrader.secmaster import utils
+
+    def _failing_batches(_store):
+        yield [(100, 33, 1_000, 10, 12, 9, 11, 5)]
+        raise RuntimeError("corrupt stream")
+
+    monkeypatch.setattr(utils, "_iter_ohlcv_batches", _failing_batches)
+
+    db_path = _make_db(tmp_path)
+    dbn_path = tmp_path / "sample.dbn"
+    dbn_path.write_bytes(_make_dbn_bytes([(100, 1_000, 10, 12, 9, 11, 5)]))
+
+    try:
+        utils.ingest_databento_dbn(dbn_path, db_path)
+    except RuntimeError as e:
+        assert "corrupt stream" in str(e)
+    else:
+        raise AssertionError("Expected RuntimeError")
+
+    con = sqlite3.connect(str(db_path))
+    assert con.execute("SELECT COUNT(*) FROM ohlcv").fetchone()[0] == 0
+    con.close()
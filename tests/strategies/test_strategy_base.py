@@ -1,9 +1,10 @@
+import dataclasses
 import uuid
 
 import pandas as pd
 
-from onesecondtrader import events, messaging, models
-from onesecondtrader.strategies.base import StrategyBase
+from onesecondtrader import events, indicators, messaging, models
+from onesecondtrader.strategies.base import ParamSpec, StrategyBase
 
 
 class RecordingStrategy(StrategyBase):
@@ -17,6 +18,34 @@ class RecordingStrategy(StrategyBase):
         pass
 
 
+class BarStrategy(StrategyBase):
+    name = "Bar Strategy"
+    symbols = ["AAPL"]
+    parameters = {"bar_period": ParamSpec(default=models.BarPeriod.SECOND)}
+
+    def setup(self) -> None:
+        self.bars_seen: list[events.market.BarReceived] = []
+        self.sma = self.add_indicator(indicators.SimpleMovingAverage(period=2))
+
+    def on_bar(self, event: events.market.BarReceived) -> None:
+        self.bars_seen.append(event)
+
+
+def _make_bar(
+    close: float, symbol: str = "AAPL", ts_event_ns: int = 1_000
+) -> events.market.BarReceived:
+    return events.market.BarReceived(
+        ts_event_ns=ts_event_ns,
+        symbol=symbol,
+        bar_period=models.BarPeriod.SECOND,
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=100,
+    )
+
+
 class RequestRecorder(messaging.Subscriber):
     def __init__(self, event_bus: messaging.EventBus) -> None:
         self.requests: list[events.requests.OrderSubmissionRequest] = []
@@ -114,3 +143,117 @@ class TestSubmitOrder:
 
         strategy.shutdown()
         recorder.shutdown()
+
+
+def _make_fill(
+    side: models.TradeSide, quantity: float, price: float, order_id=None
+) -> events.orders.FillEvent:
+    return events.orders.FillEvent(
+        ts_event_ns=1_000,
+        ts_broker_ns=1_000,
+        associated_order_id=order_id or uuid.uuid4(),
+        symbol="AAPL",
+        side=side,
+        quantity_filled=quantity,
+        fill_price=price,
+        commission=0.0,
+    )
+
+
+class TestEventDispatch:
+    def test_published_fill_updates_position(self):
+        bus = messaging.EventBus()
+        strategy = BarStrategy(bus)
+
+        bus.publish(_make_bar(100.0))
+        bus.publish(_make_fill(models.TradeSide.BUY, 10.0, 100.0))
+        bus.wait_until_system_idle()
+
+        assert strategy.position == 10.0
+        assert strategy.avg_price == 100.0
+
+        strategy.shutdown()
+
+    def test_subclassed_event_is_dispatched_to_base_handler(self):
+        class TaggedFill(events.orders.FillEvent):
+            pass
+
+        bus = messaging.EventBus()
+        strategy = BarStrategy(bus)
+        bus.publish(_make_bar(50.0))
+        bus.wait_until_system_idle()
+
+        fill = TaggedFill(
+            ts_event_ns=1_000,
+            ts_broker_ns=1_000,
+            associated_order_id=uuid.uuid4(),
+            symbol="AAPL",
+            side=models.TradeSide.SELL,
+            quantity_filled=5.0,
+            fill_price=50.0,
+            commission=0.0,
+        )
+        strategy._on_event(fill)
+        strategy._on_event(fill)
+
+        assert strategy.position == -10.0
+
+        strategy.shutdown()
+
+
+class TestBarProcessing:
+    def test_bar_updates_indicators_before_on_bar(self):
+        bus = messaging.EventBus()
+        strategy = BarStrategy(bus)
+
+        bus.publish(_make_bar(10.0, ts_event_ns=1_000))
+        bus.publish(_make_bar(20.0, ts_event_ns=2_000))
+        bus.publish(_make_bar(30.0, symbol="MSFT", ts_event_ns=3_000))
+        bus.wait_until_system_idle()
+
+        assert [bar.close for bar in strategy.bars_seen] == [10.0, 20.0]
+        assert strategy.bar.close.latest("AAPL") == 20.0
+        assert strategy.sma.latest("AAPL") == 15.0
+
+        strategy.shutdown()
+
+
+class TestPositions:
+    def test_position_tracks_average_price_across_fills(self):
+        bus = messaging.EventBus()
+        strategy = BarStrategy(bus)
+        bus.publish(_make_bar(100.0))
+        bus.wait_until_system_idle()
+
+        strategy._on_event(_make_fill(models.TradeSide.BUY, 10.0, 100.0))
+        strategy._on_event(_make_fill(models.TradeSide.BUY, 10.0, 110.0))
+        assert strategy.position == 20.0
+        assert strategy.avg_price == 105.0
+
+        strategy._on_event(_make_fill(models.TradeSide.SELL, 5.0, 120.0))
+        assert strategy.position == 15.0
+        assert strategy.avg_price == 105.0
+
+        strategy._on_event(_make_fill(models.TradeSide.SELL, 25.0, 90.0))
+        assert strategy.position == -10.0
+        assert strategy.avg_price == 90.0
+
+        strategy._on_event(_make_fill(models.TradeSide.BUY, 10.0, 80.0))
+        assert strategy.position == 0.0
+        assert strategy.avg_price == 0.0
+
+        strategy.shutdown()
+
+    def test_fills_for_untracked_symbols_are_recorded(self):
+        bus = messaging.EventBus()
+        strategy = BarStrategy(bus)
+
+        fill = dataclasses.replace(
+            _make_fill(models.TradeSide.BUY, 3.0, 10.0), symbol="MSFT"
+        )
+        strategy._on_event(fill)
+
+        assert strategy.position == 0.0
+        assert strategy._positions[strategy._sym_idx["MSFT"]] == 3.0
+
+        strategy.shutdown()